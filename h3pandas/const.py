@@ -1 +1,4 @@
 COLUMN_H3_POLYFILL = "h3_polyfill"
+
+# Minimum number of rows for which H3 functions are applied across threads
+PARALLEL_MIN_ROWS = 50_000
@@ -1,24 +1,43 @@
+from functools import lru_cache
 from typing import Union, Callable, Sequence, Any
 import warnings
 
 from typing import Literal
 
 import numpy as np
-import shapely
 import pandas as pd
 import geopandas as gpd
 
-from h3 import h3
+from h3.api import numpy_int as h3
 from pandas.core.frame import DataFrame
 from geopandas.geodataframe import GeoDataFrame
 
 from .const import COLUMN_H3_POLYFILL
-from .util.decorator import catch_invalid_h3_address, doc_standard
-from .util.functools import wrapped_partial
+from .util import vect
+from .util.decorator import doc_standard
+from .util.functools import map_chunked, wrapped_partial
 from .util.shapely import polyfill
 
 AnyDataFrame = Union[DataFrame, GeoDataFrame]
 
+# H3 API functions with a counterpart operating on arrays of uint64 H3 addresses
+VECTORIZED = {
+    h3.h3_get_resolution: vect.h3_get_resolution,
+    h3.h3_get_base_cell: vect.h3_get_base_cell,
+    h3.h3_is_valid: vect.h3_is_valid,
+    h3.h3_to_parent: vect.h3_to_parent,
+    h3.h3_to_center_child: vect.h3_to_center_child,
+    h3.h3_to_geo: vect.h3_to_geo,
+    h3.h3_to_geo_boundary: vect.h3_to_geo_boundary,
+}
+
+# List-making H3 API functions with a counterpart returning the flattened lists
+# of an array of uint64 H3 addresses along with the length of each list
+VECTORIZED_EXPLODE = {
+    h3.k_ring: vect.k_ring,
+    h3.hex_ring: vect.hex_ring,
+}
+
 
 @pd.api.extensions.register_dataframe_accessor("h3")
 class H3Accessor:
@@ -84,16 +103,7 @@ class H3Accessor:
         881e2659c3fffff    1  POINT (15.00000 51.00000)
 
         """
-        if isinstance(self._df, gpd.GeoDataFrame):
-            lngs = self._df.geometry.x
-            lats = self._df.geometry.y
-        else:
-            lngs = self._df[lng_col]
-            lats = self._df[lat_col]
-
-        h3addresses = [
-            h3.geo_to_h3(lat, lng, resolution) for lat, lng in zip(lats, lngs)
-        ]
+        h3addresses = vect.int_to_str(self._geo_to_h3(resolution, lat_col, lng_col))
 
         colname = self._format_resolution(resolution)
         assign_arg = {colname: h3addresses}
@@ -132,8 +142,7 @@ class H3Accessor:
         return self._apply_index_assign(
             h3.h3_to_geo,
             "geometry",
-            lambda x: shapely.geometry.Point(reversed(x)),
-            lambda x: gpd.GeoDataFrame(x, crs="epsg:4326"),
+            finalizer=self._set_geometry,
         )
 
     def h3_to_geo_boundary(self) -> GeoDataFrame:
@@ -160,8 +169,7 @@ class H3Accessor:
         return self._apply_index_assign(
             wrapped_partial(h3.h3_to_geo_boundary, geo_json=True),
             "geometry",
-            lambda x: shapely.geometry.Polygon(x),
-            lambda x: gpd.GeoDataFrame(x, crs="epsg:4326"),
+            finalizer=self._set_geometry,
         )
 
     @doc_standard("h3_resolution", "containing the resolution of each H3 address")
@@ -253,8 +261,8 @@ class H3Accessor:
         func = wrapped_partial(h3.k_ring, k=k)
         column_name = "h3_k_ring"
         if explode:
-            return self._apply_index_explode(func, column_name, list)
-        return self._apply_index_assign(func, column_name, list)
+            return self._apply_index_explode(func, column_name)
+        return self._apply_index_assign(func, column_name)
 
     @doc_standard(
         "h3_hex_ring",
@@ -298,8 +306,8 @@ class H3Accessor:
         func = wrapped_partial(h3.hex_ring, k=k)
         column_name = "h3_hex_ring"
         if explode:
-            return self._apply_index_explode(func, column_name, list)
-        return self._apply_index_assign(func, column_name, list)
+            return self._apply_index_explode(func, column_name)
+        return self._apply_index_assign(func, column_name)
 
     @doc_standard("h3_{resolution}", "containing the parent of each H3 address")
     def h3_to_parent(self, resolution: int = None) -> AnyDataFrame:
@@ -394,18 +402,23 @@ class H3Accessor:
         0  POLYGON ((1.00000 0.00000, 1.00000 1.00000, 0....  8475413ffffffff
         """
 
-        def func(row):
-            return list(polyfill(row.geometry, resolution, True))
-
-        result = self._df.apply(func, axis=1)
+        geometry = self._df.geometry
+        polygonal = geometry.geom_type.isin(["Polygon", "MultiPolygon"]).all()
+        if vect.wkb_to_cells is not None and polygonal:
+            cells = vect.polyfill(geometry.to_numpy(), resolution)
+            result = pd.Series(
+                [vect.int_to_str(c) for c in cells], index=self._df.index, dtype=object
+            )
+        else:
 
-        if not explode:
-            assign_args = {COLUMN_H3_POLYFILL: result}
-            return self._df.assign(**assign_args)
+            def func(row):
+                return list(polyfill(row.geometry, resolution, True))
 
-        result = result.explode().to_frame(COLUMN_H3_POLYFILL)
+            result = self._df.apply(func, axis=1)
 
-        return self._df.join(result)
+        assign_args = {COLUMN_H3_POLYFILL: result}
+        result = self._df.assign(**assign_args)
+        return result.explode(COLUMN_H3_POLYFILL) if explode else result
 
     @doc_standard("h3_cell_area", "containing the area of each H3 address")
     def cell_area(
@@ -491,11 +504,13 @@ class H3Accessor:
         h3_01
         811e3ffffffffff   11
         """
+        h3addresses = self._geo_to_h3(resolution, lat_col, lng_col)
+        columns = self._df.columns.drop([lat_col, lng_col, "geometry"], errors="ignore")
         grouped = pd.DataFrame(
-            self.geo_to_h3(resolution, lat_col, lng_col, False)
-            .drop(columns=[lat_col, lng_col, "geometry"], errors="ignore")
-            .groupby(self._format_resolution(resolution))
-            .agg(operation)
+            self._df[columns].groupby(h3addresses, sort=False).agg(operation)
+        )
+        grouped.index = pd.Index(
+            vect.int_to_str(grouped.index), name=self._format_resolution(resolution)
         )
         return grouped.h3.h3_to_geo_boundary() if return_geometry else grouped
 
@@ -552,16 +567,16 @@ class H3Accessor:
         h3_01
         811e3ffffffffff    6
         """
-        parent_h3addresses = [
-            catch_invalid_h3_address(h3.h3_to_parent)(h3address, resolution)
-            for h3address in self._df.index
-        ]
-        h3_parent_column = self._format_resolution(resolution)
-        kwargs_assign = {h3_parent_column: parent_h3addresses}
-        grouped = (
-            self._df.assign(**kwargs_assign)
-            .groupby(h3_parent_column)[[c for c in self._df.columns if c != "geometry"]]
-            .agg(operation)
+        h3addresses = self._index_to_int()
+        self._validate_index(h3addresses)
+        parent_h3addresses = vect.h3_to_parent(h3addresses, resolution)
+        columns = self._df.columns.drop("geometry", errors="ignore")
+        grouped = pd.DataFrame(
+            self._df[columns].groupby(parent_h3addresses, sort=False).agg(operation)
+        )
+        grouped.index = pd.Index(
+            self._int_like_index(grouped.index.to_numpy()),
+            name=self._format_resolution(resolution),
         )
 
         return grouped.h3.h3_to_geo_boundary() if return_geometry else grouped
@@ -670,12 +685,18 @@ class H3Accessor:
 
         # Unweighted case
         if weights is None:
+            h3addresses = self._index_to_int()
+            self._validate_index(h3addresses)
+            cells, counts = vect.k_ring(h3addresses, k)
             result = pd.DataFrame(
-                self._df.h3.k_ring(k, explode=True)
-                .groupby("h3_k_ring")
+                self._df.iloc[np.repeat(np.arange(len(self._df)), counts)]
+                .groupby(cells)
                 .sum()
                 .divide((1 + 3 * k * (k + 1)))
             )
+            result.index = pd.Index(
+                self._int_like_index(result.index.to_numpy()), name="h3_k_ring"
+            )
 
             return result.h3.h3_to_geo_boundary() if return_geometry else result
 
@@ -687,21 +708,22 @@ class H3Accessor:
         multipliers = np.array([1] + [i * 6 for i in range(1, len(weights))])
         weights = weights / (weights * multipliers).sum()
 
-        # This should be exploded hex ring
-        def weighted_hex_ring(df, k, normalized_weight):
-            return df.h3.hex_ring(k, explode=True).h3._multiply_numeric(
-                normalized_weight
-            )
+        # Explode all hex rings at once and aggregate them in a single groupby
+        h3addresses = self._index_to_int()
+        self._validate_index(h3addresses)
+        rings = [vect.hex_ring(h3addresses, i) for i in range(len(weights))]
+        cells = np.concatenate([ring_cells for ring_cells, _ in rings])
+        positions = np.concatenate(
+            [np.repeat(np.arange(len(self._df)), counts) for _, counts in rings]
+        )
+        row_weights = np.concatenate(
+            [np.repeat(weights[i], counts.sum()) for i, (_, counts) in enumerate(rings)]
+        )
 
-        result = (
-            pd.concat(
-                [
-                    weighted_hex_ring(self._df, i, weights[i])
-                    for i in range(len(weights))
-                ]
-            )
-            .groupby("h3_hex_ring")
-            .sum()
+        exploded = self._df.iloc[positions].h3._multiply_numeric(row_weights)
+        result = pd.DataFrame(exploded.groupby(cells).sum())
+        result.index = pd.Index(
+            self._int_like_index(result.index.to_numpy()), name="h3_hex_ring"
         )
 
         return result.h3.h3_to_geo_boundary() if return_geometry else result
@@ -744,8 +766,8 @@ class H3Accessor:
         84754e9ffffffff      0  POLYGON ((0.61922 0.47649, 0.71427 0.67520, 0....
         8475413ffffffff      0  POLYGON ((0.91001 0.70597, 1.00521 0.90497, 0....
         """
-        result = self._df.h3.polyfill(resolution, explode=True)
-        uncovered_rows = result[COLUMN_H3_POLYFILL].isna()
+        result = self._df.h3.polyfill(resolution)
+        uncovered_rows = result[COLUMN_H3_POLYFILL].str.len().to_numpy() == 0
         n_uncovered_rows = uncovered_rows.sum()
         if n_uncovered_rows > 0:
             warnings.warn(
@@ -754,21 +776,40 @@ class H3Accessor:
             )
             result = result.loc[~uncovered_rows]
 
-        result = result.reset_index().set_index(COLUMN_H3_POLYFILL)
+        result = (
+            result.explode(COLUMN_H3_POLYFILL)
+            .reset_index()
+            .set_index(COLUMN_H3_POLYFILL)
+        )
 
         return result.h3.h3_to_geo_boundary() if return_geometry else result
 
     # Private methods
 
+    def _geo_to_h3(self, resolution: int, lat_col: str, lng_col: str) -> np.ndarray:
+        """Helper method. Computes the uint64 H3 address of each row's point."""
+        if isinstance(self._df, gpd.GeoDataFrame):
+            lngs = self._df.geometry.x.to_numpy()
+            lats = self._df.geometry.y.to_numpy()
+        else:
+            lngs = self._df[lng_col].to_numpy()
+            lats = self._df[lat_col].to_numpy()
+
+        return vect.geo_to_h3(lats, lngs, resolution)
+
     def _apply_index_assign(
         self,
         func: Callable,
         column_name: str,
-        processor: Callable = lambda x: x,
+        processor: Callable = None,
         finalizer: Callable = lambda x: x,
     ) -> Any:
         """Helper method. Applies `func` to index and assigns the result to `column`.
 
+        If `func` (or the function it wraps as a partial) has a vectorized
+        counterpart and no `processor` is given, the whole index is processed
+        at once. Otherwise `func` is applied to each uint64 H3 address.
+
         Parameters
         ----------
         func : Callable
@@ -776,7 +817,8 @@ class H3Accessor:
         column_name : str
             name of the resulting column
         processor : Callable
-            (Optional) further processes the result of func. Default: identity
+            (Optional) further processes the result of func. Passing a processor
+            disables the vectorized dispatch. Default: None
         finalizer : Callable
             (Optional) further processes the resulting dataframe. Default: identity
 
@@ -785,11 +827,77 @@ class H3Accessor:
         Dataframe with column `column` containing the result of `func`.
         If using `finalizer`, can return anything the `finalizer` returns.
         """
-        func = catch_invalid_h3_address(func)
-        result = [processor(func(h3address)) for h3address in self._df.index]
+        h3addresses = self._index_to_int()
+        key = getattr(func, "func", func)
+        if processor is None and key in VECTORIZED:
+            result = self._apply_vectorized(VECTORIZED[key], func, h3addresses)
+            if result.dtype == np.uint64:
+                result = self._int_like_index(result)
+        elif processor is None and key in VECTORIZED_EXPLODE:
+            values, counts = self._apply_vectorized(
+                VECTORIZED_EXPLODE[key], func, h3addresses
+            )
+            values = self._int_like_index(values)
+            ends = np.cumsum(counts).tolist()
+            result = [list(values[e - c : e]) for c, e in zip(counts.tolist(), ends)]
+        else:
+            self._validate_index(h3addresses)
+            processor = processor or (lambda x: x)
+            result = map_chunked(lambda x: processor(func(x)), h3addresses.tolist())
         assign_args = {column_name: result}
         return finalizer(self._df.assign(**assign_args))
 
+    def _apply_vectorized(
+        self, vectorized: Callable, func: Callable, h3addresses: np.ndarray
+    ) -> Any:
+        """Helper method. Calls `vectorized` with the arguments bound to `func`."""
+        if vectorized is not vect.h3_is_valid:
+            self._validate_index(h3addresses)
+        try:
+            return vectorized(
+                h3addresses, *getattr(func, "args", ()), **getattr(func, "keywords", {})
+            )
+        except ValueError as e:
+            message = "H3 method raised an error. Is the H3 address correct?"
+            message += f"\nCaller: {func.__name__}"
+            message += f"\nOriginal error: {repr(e)}"
+            raise ValueError(message)
+
+    def _validate_index(self, h3addresses: np.ndarray) -> None:
+        """Helper method. Validates all of the index at once, so that H3 functions
+        can be applied without catching errors for each address.
+
+        Parameters
+        ----------
+        h3addresses : np.ndarray
+            The index as uint64 H3 addresses
+
+        Raises
+        ------
+        ValueError
+            When an invalid H3 address is encountered
+        """
+        (invalid,) = np.where(~vect.h3_is_valid(h3addresses))
+        if len(invalid) > 0:
+            addresses = ", ".join(repr(a) for a in self._df.index[invalid[:5]])
+            message = "H3 method raised an error. Is the H3 address correct?"
+            message += f"\n{len(invalid)} invalid H3 addresses, e.g. {addresses}"
+            raise ValueError(message)
+
+    def _index_to_int(self) -> np.ndarray:
+        """Helper method. The index as uint64 H3 addresses.
+        Hexadecimal strings are parsed, integers are used as they are."""
+        if pd.api.types.is_integer_dtype(self._df.index):
+            return self._df.index.to_numpy().astype(np.uint64)
+        return vect.str_to_int(self._df.index)
+
+    def _int_like_index(self, h3addresses: np.ndarray) -> Union[np.ndarray, list]:
+        """Helper method. Converts uint64 H3 addresses to the representation
+        used by the index: integers of the same dtype, strings otherwise."""
+        if pd.api.types.is_integer_dtype(self._df.index):
+            return h3addresses.astype(self._df.index.dtype)
+        return vect.int_to_str(h3addresses)
+
     def _apply_index_explode(
         self,
         func: Callable,
@@ -817,27 +925,43 @@ class H3Accessor:
         Dataframe with column `column` containing the result of `func`.
         If using `finalizer`, can return anything the `finalizer` returns.
         """
-        func = catch_invalid_h3_address(func)
-        result = (
-            pd.DataFrame.from_dict(
-                {h3address: processor(func(h3address)) for h3address in self._df.index},
-                orient="index",
+        h3addresses = self._index_to_int()
+        key = getattr(func, "func", func)
+        if key in VECTORIZED_EXPLODE:
+            values, counts = self._apply_vectorized(
+                VECTORIZED_EXPLODE[key], func, h3addresses
             )
-            .stack()
-            .to_frame(column_name)
-            .reset_index(level=1, drop=True)
-        )
-        result = self._df.join(result)
-        return finalizer(result)
+            values = self._int_like_index(values)
+        else:
+            self._validate_index(h3addresses)
+            lists = [processor(func(h3address)) for h3address in h3addresses.tolist()]
+            counts = np.array([len(x) for x in lists], dtype=np.int64)
+            values = [value for x in lists for value in x]
 
-    # TODO: types, doc, ..
-    def _multiply_numeric(self, value):
+        # Repeat each row positionally by the length of its list
+        result = self._df.iloc[np.repeat(np.arange(len(self._df)), counts)]
+        assign_args = {column_name: values}
+        return finalizer(result.assign(**assign_args))
+
+    @staticmethod
+    def _set_geometry(df: AnyDataFrame) -> GeoDataFrame:
+        """Helper method. Sets the `geometry` column as the active geometry
+        in epsg:4326 without copying the other columns."""
+        if isinstance(df, GeoDataFrame):
+            df.set_geometry("geometry", inplace=True)
+            df.set_crs("epsg:4326", allow_override=True, inplace=True)
+            return df
+        return gpd.GeoDataFrame(df, geometry="geometry", crs="epsg:4326", copy=False)
+
+    def _multiply_numeric(self, value: Union[float, np.ndarray]) -> AnyDataFrame:
+        """Helper method. Multiplies all numeric columns by `value`,
+        a scalar or an array with one value per row."""
         columns_numeric = self._df.select_dtypes(include=["number"]).columns
-        assign_args = {
-            column: self._df[column].multiply(value) for column in columns_numeric
-        }
-        return self._df.assign(**assign_args)
+        # A single block-wise multiply instead of one per column
+        product = self._df[columns_numeric].multiply(value, axis=0)
+        return self._df.assign(**product)
 
     @staticmethod
+    @lru_cache(maxsize=32)
     def _format_resolution(resolution: int) -> str:
         return f"h3_{str(resolution).zfill(2)}"
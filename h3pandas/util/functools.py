@@ -1,4 +1,10 @@
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial, update_wrapper
+from typing import Any, Callable, List, Sequence
+
+from ..const import PARALLEL_MIN_ROWS
 
 
 def wrapped_partial(func, *args, **kwargs):
@@ -6,3 +12,49 @@ def wrapped_partial(func, *args, **kwargs):
     partial_func = partial(func, *args, **kwargs)
     update_wrapper(partial_func, func)
     return partial_func
+
+
+def gil_enabled() -> bool:
+    """Whether the interpreter runs with the GIL (always before Python 3.13)"""
+    return getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+def run_chunked(
+    func: Callable[[int, int], Any], n_items: int, min_size: int = PARALLEL_MIN_ROWS
+) -> List:
+    """Calls `func(start, stop)` over consecutive ranges covering `n_items` items
+
+    On free-threaded Python builds, at least `min_size` items are split into
+    one range per CPU, each processed by its own thread. With the GIL the
+    threads could not run concurrently, so `func` is called once for all items.
+
+    Returns
+    -------
+    The results of `func` for each range, in order
+    """
+    n_workers = os.cpu_count() or 1
+    if n_items < min_size or n_workers == 1 or gil_enabled():
+        return [func(0, n_items)]
+
+    chunk_size = -(-n_items // n_workers)
+    starts = range(0, n_items, chunk_size)
+    with ThreadPoolExecutor(n_workers) as executor:
+        results = executor.map(
+            lambda start: func(start, min(start + chunk_size, n_items)), starts
+        )
+    return list(results)
+
+
+def map_chunked(
+    func: Callable, items: Sequence, min_size: int = PARALLEL_MIN_ROWS
+) -> List:
+    """Maps `func` over `items`, preserving order
+
+    Threaded on free-threaded Python builds, see `run_chunked`.
+    """
+    results = run_chunked(
+        lambda start, stop: [func(item) for item in items[start:stop]],
+        len(items),
+        min_size,
+    )
+    return [result for chunk in results for result in chunk]
@@ -0,0 +1,339 @@
+import warnings
+from itertools import chain
+from typing import Callable, Iterable, List, Tuple
+
+import numpy as np
+import pandas as pd
+import shapely
+from h3.api import numpy_int
+
+from .functools import run_chunked
+
+try:
+    # `h3.unstable` warns on import that its API is experimental
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)
+        from h3.unstable import vect as _h3_vect
+except ImportError:
+    _h3_vect = None
+
+try:
+    from h3ronpy import ContainmentMode
+
+    try:
+        from h3ronpy.vector import wkb_to_cells
+    except ImportError:
+        from h3ronpy.arrow.vector import wkb_to_cells
+except ImportError:
+    wkb_to_cells = None
+
+# Base cells which are pentagons, see h3 `_isBaseCellPentagon`
+PENTAGON_BASE_CELLS = np.array([4, 14, 24, 38, 49, 58, 63, 72, 83, 97, 107, 117])
+MAX_H3_RES = 15
+NUM_BASE_CELLS = 122
+
+# Hexadecimal digit value of each byte, 255 marks a non-hex character
+_HEX_LOOKUP = np.full(256, 255, dtype=np.uint8)
+for _i, _c in enumerate("0123456789abcdef"):
+    _HEX_LOOKUP[ord(_c)] = _i
+    _HEX_LOOKUP[ord(_c.upper())] = _i
+
+
+def geo_to_h3(lats: np.ndarray, lngs: np.ndarray, resolution: int) -> np.ndarray:
+    """h3.geo_to_h3 over arrays of coordinates
+
+    Uses the vectorized Cython implementation from `h3.unstable.vect`
+    if available, otherwise falls back to a loop over the scalar API.
+
+    Parameters
+    ----------
+    lats : np.ndarray
+        Latitudes
+    lngs : np.ndarray
+        Longitudes
+    resolution : int
+        H3 resolution
+
+    Returns
+    -------
+    Array of H3 addresses as uint64
+
+    Raises
+    ------
+    ValueError
+        When the resolution is not between 0 and 15
+    """
+    if not 0 <= resolution <= MAX_H3_RES:
+        raise ValueError(f"Invalid resolution {resolution}")
+    lats = np.ascontiguousarray(lats, dtype=np.float64)
+    lngs = np.ascontiguousarray(lngs, dtype=np.float64)
+    if _h3_vect is not None:
+        return _h3_vect.geo_to_h3(lats, lngs, resolution)
+
+    return np.fromiter(
+        (numpy_int.geo_to_h3(lat, lng, resolution) for lat, lng in zip(lats, lngs)),
+        dtype=np.uint64,
+        count=len(lats),
+    )
+
+
+def int_to_str(h3addresses: np.ndarray) -> List[str]:
+    """Convert an array of uint64 H3 addresses to their hexadecimal form"""
+    return [format(h3address, "x") for h3address in h3addresses.tolist()]
+
+
+def str_to_int(h3addresses: Iterable[str]) -> np.ndarray:
+    """Convert hexadecimal H3 addresses to uint64
+
+    Addresses which cannot be parsed are converted to 0, an invalid H3 address.
+
+    Parameters
+    ----------
+    h3addresses : Iterable[str]
+        H3 addresses in their hexadecimal form
+
+    Returns
+    -------
+    Array of H3 addresses as uint64
+    """
+    h3addresses = np.asarray(h3addresses, dtype=object)
+    n = len(h3addresses)
+    if pd.api.types.infer_dtype(h3addresses, skipna=False) != "string":
+        return _str_to_int_scalar(h3addresses, np.ones(n, dtype=bool))
+    # Longer strings are no H3 addresses, keep them from widening the byte matrix
+    short = np.fromiter(map(len, h3addresses), dtype=np.int64, count=n) <= 16
+    try:
+        chars = np.where(short, h3addresses, "").astype(bytes)
+    except UnicodeEncodeError:
+        return _str_to_int_scalar(h3addresses, np.ones(n, dtype=bool))
+
+    lengths = np.char.str_len(chars)
+    digits = _HEX_LOOKUP[chars.view(np.uint8).reshape(n, chars.dtype.itemsize)]
+
+    result = np.zeros(n, dtype=np.uint64)
+    parsed = (lengths > 0) & (lengths <= 16)
+    for position in range(digits.shape[1]):
+        inside = position < lengths
+        digit = digits[:, position].astype(np.uint64)
+        parsed &= ~inside | (digit != 255)
+        result = np.where(inside, (result << np.uint64(4)) | digit, result)
+
+    # Defer to Python's parser for anything unusual, e.g. a `0x` prefix
+    return np.where(parsed, result, _str_to_int_scalar(h3addresses, ~parsed))
+
+
+def _str_to_int_scalar(h3addresses: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    result = np.zeros(len(h3addresses), dtype=np.uint64)
+    for i in np.flatnonzero(mask):
+        try:
+            result[i] = int(h3addresses[i], 16)
+        except (TypeError, ValueError, OverflowError):
+            pass
+    return result
+
+
+def h3_get_resolution(h3addresses: np.ndarray) -> np.ndarray:
+    """Resolution of each of the uint64 H3 addresses"""
+    return ((h3addresses >> np.uint64(52)) & np.uint64(0xF)).astype(np.int64)
+
+
+def h3_get_base_cell(h3addresses: np.ndarray) -> np.ndarray:
+    """Base cell of each of the uint64 H3 addresses"""
+    return ((h3addresses >> np.uint64(45)) & np.uint64(0x7F)).astype(np.int64)
+
+
+def h3_is_valid(h3addresses: np.ndarray) -> np.ndarray:
+    """Validity of each of the uint64 H3 addresses
+
+    Mirrors h3's `h3IsValid` using bitwise operations over the whole array.
+    """
+    h3addresses = np.asarray(h3addresses, dtype=np.uint64)
+    high_bit_and_mode = h3addresses >> np.uint64(59)
+    reserved = (h3addresses >> np.uint64(56)) & np.uint64(0x7)
+    resolution = h3_get_resolution(h3addresses)
+    base_cell = h3_get_base_cell(h3addresses)
+
+    valid = (high_bit_and_mode == 1) & (reserved == 0) & (base_cell < NUM_BASE_CELLS)
+
+    first_digit = np.zeros(len(h3addresses), dtype=np.uint64)
+    for r in range(1, MAX_H3_RES + 1):
+        digit = (h3addresses >> np.uint64(3 * (MAX_H3_RES - r))) & np.uint64(0x7)
+        used = r <= resolution
+        valid &= np.where(used, digit != 7, digit == 7)
+        first_digit = np.where(used & (first_digit == 0), digit, first_digit)
+
+    # Pentagons have no cells in the deleted K axes subsequence
+    valid &= ~(np.isin(base_cell, PENTAGON_BASE_CELLS) & (first_digit == 1))
+    return valid
+
+
+def h3_to_parent(h3addresses: np.ndarray, res: int = None) -> np.ndarray:
+    """h3.h3_to_parent over an array of uint64 H3 addresses
+
+    Raises
+    ------
+    ValueError
+        When the parent resolution is not coarser than the address' resolution
+    """
+    resolution = h3_get_resolution(h3addresses)
+    parent_resolution = resolution - 1 if res is None else res
+    if np.any((parent_resolution < 0) | (parent_resolution > resolution)):
+        raise ValueError(f"Invalid parent resolution {res}")
+    if _h3_vect is not None:
+        return _h3_vect.h3_to_parent(h3addresses, res)
+
+    return np.fromiter(
+        (numpy_int.h3_to_parent(h3address, res) for h3address in h3addresses.tolist()),
+        dtype=np.uint64,
+        count=len(h3addresses),
+    )
+
+
+def h3_to_center_child(h3addresses: np.ndarray, res: int = None) -> np.ndarray:
+    """h3.h3_to_center_child over an array of uint64 H3 addresses
+
+    Raises
+    ------
+    ValueError
+        When the child resolution is not finer than the address' resolution
+    """
+    resolution = h3_get_resolution(h3addresses)
+    child_resolution = resolution + 1 if res is None else np.full_like(resolution, res)
+    if np.any((child_resolution < resolution) | (child_resolution > MAX_H3_RES)):
+        raise ValueError(f"Invalid child resolution {res}")
+
+    # Set the resolution and zero the digits between the two resolutions
+    result = h3addresses & ~np.uint64(0xF << 52)
+    result |= child_resolution.astype(np.uint64) << np.uint64(52)
+    for r in range(1, MAX_H3_RES + 1):
+        digit_mask = np.uint64(0x7 << (3 * (MAX_H3_RES - r)))
+        center = (r > resolution) & (r <= child_resolution)
+        result = np.where(center, result & ~digit_mask, result)
+    return result
+
+
+def h3_to_geo(h3addresses: np.ndarray) -> np.ndarray:
+    """Centroids of uint64 H3 addresses as an array of shapely Points"""
+    coords = np.array(
+        [numpy_int.h3_to_geo(h3address) for h3address in h3addresses.tolist()],
+        dtype=np.float64,
+    ).reshape(-1, 2)
+    return shapely.points(coords[:, 1], coords[:, 0])
+
+
+def h3_to_geo_boundary(h3addresses: np.ndarray, geo_json: bool = False) -> np.ndarray:
+    """Boundaries of uint64 H3 addresses as an array of shapely Polygons
+
+    Parameters
+    ----------
+    h3addresses : np.ndarray
+        H3 addresses as uint64
+    geo_json : bool
+        If True, coordinates are lng/lat. Default: False (lat/lng)
+
+    Returns
+    -------
+    Array of Polygons
+    """
+    # GeoJSON boundaries are closed rings, as required by from_ragged_array
+    boundaries = [
+        numpy_int.h3_to_geo_boundary(h3address, True)
+        for h3address in h3addresses.tolist()
+    ]
+    coords = np.array(list(chain.from_iterable(boundaries)), dtype=np.float64)
+    coords = coords.reshape(-1, 2)
+    if not geo_json:
+        coords = np.ascontiguousarray(coords[:, ::-1])
+
+    # Pentagons and cells crossing icosahedron edges differ in their vertex count
+    ring_offsets = np.zeros(len(boundaries) + 1, dtype=np.int64)
+    np.cumsum([len(boundary) for boundary in boundaries], out=ring_offsets[1:])
+    polygon_offsets = np.arange(len(boundaries) + 1, dtype=np.int64)
+    return shapely.from_ragged_array(
+        shapely.GeometryType.POLYGON, coords, (ring_offsets, polygon_offsets)
+    )
+
+
+def polyfill(geometries: np.ndarray, resolution: int) -> List[np.ndarray]:
+    """Fill an array of shapely (Multi)Polygons with H3 cells using h3ronpy
+
+    Cells are contained if their centroid falls into the polygon,
+    as in h3.polyfill.
+
+    Parameters
+    ----------
+    geometries : np.ndarray
+        Polygons or MultiPolygons to fill
+    resolution : int
+        H3 resolution of the filling cells
+
+    Returns
+    -------
+    Array of uint64 H3 addresses for each geometry
+    """
+    cells = wkb_to_cells(
+        shapely.to_wkb(geometries),
+        resolution,
+        containment_mode=ContainmentMode.ContainsCentroid,
+    )
+    return [np.array(c or [], dtype=np.uint64) for c in cells.to_pylist()]
+
+
+def k_ring(h3addresses: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """h3.k_ring over an array of uint64 H3 addresses
+
+    Parameters
+    ----------
+    h3addresses : np.ndarray
+        H3 addresses as uint64
+    k : int
+        the distance from the origin H3 address
+
+    Returns
+    -------
+    Flat array of the k-ring cells of all addresses, and the number of cells
+    in the k-ring of each address (fewer than 1 + 3k(k + 1) around pentagons)
+    """
+    return _rings(numpy_int.k_ring, h3addresses, k, 1 + 3 * k * (k + 1))
+
+
+def hex_ring(h3addresses: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """h3.hex_ring over an array of uint64 H3 addresses
+
+    Parameters
+    ----------
+    h3addresses : np.ndarray
+        H3 addresses as uint64
+    k : int
+        the distance from the origin H3 address
+
+    Returns
+    -------
+    Flat array of the hex ring cells of all addresses, and the number of cells
+    in the hex ring of each address (fewer than 6k around pentagons)
+    """
+    return _rings(numpy_int.hex_ring, h3addresses, k, 6 * k if k > 0 else 1)
+
+
+def _rings(
+    func: Callable, h3addresses: np.ndarray, k: int, size: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Fills the rings of at most `size` cells into a preallocated array
+
+    Each range of addresses writes to its own rows, so that the ranges can be
+    filled concurrently on free-threaded Python builds.
+    """
+    cells = np.zeros((len(h3addresses), size), dtype=np.uint64)
+    counts = np.empty(len(h3addresses), dtype=np.int64)
+
+    def fill(start: int, stop: int):
+        for i, h3address in enumerate(h3addresses[start:stop].tolist(), start):
+            ring = func(h3address, k)
+            cells[i, : len(ring)] = ring
+            counts[i] = len(ring)
+
+    run_chunked(fill, len(h3addresses))
+
+    if (counts == size).all():
+        return cells.ravel(), counts
+    return cells[np.arange(size) < counts[:, None]], counts
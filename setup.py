@@ -43,7 +43,7 @@ setup(
         "geopandas",
         "numpy",
         "pandas",
-        "shapely",
+        "shapely>=2.0",
         "h3",
         "numpy",
         "typing-extensions",
@@ -52,5 +52,6 @@ setup(
     extras_require={
         "test": ["pytest", "pytest-cov", "flake8"],
         "docs": ["sphinx", "numpydoc", "pytest-sphinx-theme", "typing-extensions"],
+        "h3ronpy": ["h3ronpy"],
     },
 )
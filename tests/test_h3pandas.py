@@ -1,4 +1,5 @@
 from h3pandas import h3pandas  # noqa: F401
+from h3pandas.util import vect
 from h3 import h3
 import pytest
 from shapely.geometry import Polygon, box
@@ -95,10 +96,21 @@ class TestGeoToH3:
 
         pd.testing.assert_frame_equal(expected, result)
 
+    def test_geo_to_h3_float_resolution(self, basic_dataframe):
+        result = basic_dataframe.h3.geo_to_h3(9.0)
+        assert list(result.index) == ["891e3097383ffff", "891e2659c2fffff"]
+
     def test_geo_to_h3_polygon(self, basic_geodataframe_polygon):
         with pytest.raises(ValueError):
             basic_geodataframe_polygon.h3.geo_to_h3(9)
 
+    def test_geo_to_h3_invalid_resolution(self, basic_dataframe):
+        with pytest.raises(ValueError):
+            basic_dataframe.h3.geo_to_h3(16)
+
+        with pytest.raises(ValueError):
+            basic_dataframe.h3.geo_to_h3(-1)
+
 
 class TestH3ToGeo:
     def test_h3_to_geo(self, indexed_dataframe):
@@ -138,9 +150,21 @@ class TestH3ToGeo:
 
 
 class TestH3ToGeoBoundary:
+    def test_h3_to_geo_boundary_geodataframe(self, indexed_dataframe):
+        gdf = gpd.GeoDataFrame(
+            indexed_dataframe,
+            geometry=gpd.points_from_xy([0, 0], [0, 0]),
+            crs="epsg:3857",
+        )
+        result = gdf.h3.h3_to_geo_boundary()
+        expected = indexed_dataframe.h3.h3_to_geo_boundary()
+        assert_geodataframe_equal(expected, result)
+        assert gdf.crs == "epsg:3857"
+        assert (gdf.geom_type == "Point").all()
+
     def test_h3_to_geo_boundary_wrong_index(self, indexed_dataframe):
         indexed_dataframe.index = [str(indexed_dataframe.index[0])] + ["invalid"]
-        with pytest.raises(ValueError):
+        with pytest.raises(ValueError, match="'invalid'"):
             indexed_dataframe.h3.h3_to_geo_boundary()
 
 
@@ -166,6 +190,25 @@ class TestH3ToParent:
 
         pd.testing.assert_frame_equal(expected, result)
 
+    def test_h3_to_parent_integer_index(self, h3_dataframe_with_values):
+        h3_dataframe_with_values.index = [
+            h3.string_to_h3(h) for h in h3_dataframe_with_values.index
+        ]
+        h3_parent = h3.string_to_h3("811f3ffffffffff")
+        result = h3_dataframe_with_values.h3.h3_to_parent(1)
+        expected = h3_dataframe_with_values.assign(h3_01=h3_parent)
+
+        pd.testing.assert_frame_equal(expected, result)
+
+    def test_h3_to_parent_finer_resolution(self, h3_dataframe_with_values):
+        with pytest.raises(ValueError):
+            h3_dataframe_with_values.h3.h3_to_parent(10)
+
+    def test_h3_to_parent_wrong_index(self, h3_dataframe_with_values):
+        h3_dataframe_with_values.index = ["891f1d48177ffff", "invalid", "0"]
+        with pytest.raises(ValueError):
+            h3_dataframe_with_values.h3.h3_to_parent(1)
+
 
 class TestH3ToCenterChild:
     def test_h3_to_center_child(self, indexed_dataframe):
@@ -221,6 +264,15 @@ class TestPolyfill:
         )  # Convert to set for testing
         assert_geodataframe_equal(expected, result)
 
+    def test_polyfill_without_h3ronpy(self, h3_geodataframe_with_values, monkeypatch):
+        monkeypatch.setattr(vect, "wkb_to_cells", None)
+        expected = h3_geodataframe_with_values.h3.polyfill(10)
+        monkeypatch.undo()
+        result = h3_geodataframe_with_values.h3.polyfill(10)
+        expected["h3_polyfill"] = expected["h3_polyfill"].apply(set)
+        result["h3_polyfill"] = result["h3_polyfill"].apply(set)
+        assert_geodataframe_equal(expected, result)
+
     def test_polyfill_explode(self, h3_geodataframe_with_values):
         expected_indices = set().union(
             *[
@@ -301,6 +353,11 @@ class TestH3GetBaseCell:
 
 
 class TestKRing:
+    def test_h3_k_ring_wrong_index(self, indexed_dataframe):
+        indexed_dataframe.index = [str(indexed_dataframe.index[0])] + ["invalid"]
+        with pytest.raises(ValueError, match="'invalid'"):
+            indexed_dataframe.h3.k_ring(1, explode=True)
+
     def test_h3_0_ring(self, indexed_dataframe):
         expected = indexed_dataframe.assign(
             h3_k_ring=[[h] for h in indexed_dataframe.index]
@@ -336,6 +393,14 @@ class TestKRing:
         )  # Convert to set for testing
         pd.testing.assert_frame_equal(expected, result)
 
+    def test_h3_k_ring_integer_index(self, indexed_dataframe):
+        expected = indexed_dataframe.h3.k_ring(explode=True)
+        expected.index = [h3.string_to_h3(h) for h in expected.index]
+        expected["h3_k_ring"] = expected["h3_k_ring"].apply(h3.string_to_h3)
+        indexed_dataframe.index = [h3.string_to_h3(h) for h in indexed_dataframe.index]
+        result = indexed_dataframe.h3.k_ring(explode=True)
+        pd.testing.assert_frame_equal(expected, result)
+
     def test_h3_k_ring_explode(self, indexed_dataframe):
         expected_indices = set().union(
             *[
@@ -467,23 +532,28 @@ class TestGeoToH3Aggregate:
 class TestH3ToParentAggregate:
     def test_h3_to_parent_aggregate(self, h3_geodataframe_with_values):
         result = h3_geodataframe_with_values.h3.h3_to_parent_aggregate(8)
-        # TODO: Why does Pandas not preserve the order of groups here?
-        index = pd.Index(["881f1d4811fffff", "881f1d4817fffff"], name="h3_08")
+        # Groups are in order of their first appearance
+        index = pd.Index(["881f1d4817fffff", "881f1d4811fffff"], name="h3_08")
         geometry = [Polygon(h3.h3_to_geo_boundary(h, True)) for h in index]
         expected = gpd.GeoDataFrame(
-            {"val": [5, 3]}, geometry=geometry, index=index, crs="epsg:4326"
+            {"val": [3, 5]}, geometry=geometry, index=index, crs="epsg:4326"
         )
 
         assert_geodataframe_equal(expected, result)
 
     def test_h3_to_parent_aggregate_no_geometry(self, h3_dataframe_with_values):
-        index = pd.Index(["881f1d4811fffff", "881f1d4817fffff"], name="h3_08")
-        expected = pd.DataFrame({"val": [5, 3]}, index=index)
+        index = pd.Index(["881f1d4817fffff", "881f1d4811fffff"], name="h3_08")
+        expected = pd.DataFrame({"val": [3, 5]}, index=index)
         result = h3_dataframe_with_values.h3.h3_to_parent_aggregate(
             8, return_geometry=False
         )
         pd.testing.assert_frame_equal(expected, result)
 
+    def test_h3_to_parent_aggregate_wrong_index(self, h3_dataframe_with_values):
+        h3_dataframe_with_values.index = ["891f1d48177ffff", "invalid", "0"]
+        with pytest.raises(ValueError):
+            h3_dataframe_with_values.h3.h3_to_parent_aggregate(8)
+
 
 class TestKRingSmoothing:
     def test_h3_k_ring_smoothing_k_vs_weighting(self, h3_dataframe_with_values):
@@ -519,6 +589,19 @@ class TestKRingSmoothing:
         result = set(data.h3.k_ring_smoothing(weights=[2, 1])["val"])
         assert expected == result
 
+    def test_h3_k_ring_smoothing_weighted_integer_index(self, h3_dataframe_with_values):
+        expected = h3_dataframe_with_values.h3.k_ring_smoothing(
+            weights=[2, 1], return_geometry=False
+        )
+        h3_dataframe_with_values.index = [
+            h3.string_to_h3(h) for h in h3_dataframe_with_values.index
+        ]
+        result = h3_dataframe_with_values.h3.k_ring_smoothing(
+            weights=[2, 1], return_geometry=False
+        )
+        assert list(result.index) == [h3.string_to_h3(h) for h in expected.index]
+        assert result["val"].tolist() == expected["val"].tolist()
+
 
 class TestPolyfillResample:
     def test_polyfill_resample(self, h3_geodataframe_with_values):
@@ -0,0 +1,24 @@
+from h3pandas.util import functools
+from h3pandas.util.functools import map_chunked, run_chunked
+
+
+class TestMapChunked:
+    def test_map_chunked(self):
+        assert map_chunked(str, range(5)) == ["0", "1", "2", "3", "4"]
+
+    def test_map_chunked_threads(self, monkeypatch):
+        monkeypatch.setattr(functools, "gil_enabled", lambda: False)
+        monkeypatch.setattr(functools.os, "cpu_count", lambda: 3)
+        items = list(range(10))
+        assert map_chunked(str, items, min_size=2) == [str(i) for i in items]
+
+
+class TestRunChunked:
+    def test_run_chunked(self):
+        assert run_chunked(lambda start, stop: (start, stop), 5) == [(0, 5)]
+
+    def test_run_chunked_threads(self, monkeypatch):
+        monkeypatch.setattr(functools, "gil_enabled", lambda: False)
+        monkeypatch.setattr(functools.os, "cpu_count", lambda: 3)
+        result = run_chunked(lambda start, stop: (start, stop), 10, min_size=2)
+        assert result == [(0, 4), (4, 8), (8, 10)]
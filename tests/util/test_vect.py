@@ -0,0 +1,120 @@
+from functools import partial
+
+from h3 import h3
+import numpy as np
+import pytest
+from shapely.geometry import Point, Polygon
+
+from h3pandas.util import functools, vect
+from h3pandas.util.functools import run_chunked
+from h3pandas.util.vect import (
+    geo_to_h3,
+    h3_is_valid,
+    h3_to_geo,
+    h3_to_geo_boundary,
+    hex_ring,
+    int_to_str,
+    k_ring,
+    str_to_int,
+)
+
+
+class TestGeoToH3:
+    def test_geo_to_h3(self):
+        lats = np.array([50, 51])
+        lngs = np.array([14, 15])
+        expected = [h3.geo_to_h3(lat, lng, 9) for lat, lng in zip(lats, lngs)]
+        result = int_to_str(geo_to_h3(lats, lngs, 9))
+        assert expected == result
+
+    def test_geo_to_h3_dtype(self):
+        result = geo_to_h3([50], [14], 9)
+        assert result.dtype == np.uint64
+
+    def test_geo_to_h3_invalid_resolution(self):
+        with pytest.raises(ValueError):
+            geo_to_h3([50], [14], 16)
+
+        with pytest.raises(ValueError):
+            geo_to_h3([50], [14], -1)
+
+
+class TestStrToInt:
+    def test_str_to_int(self):
+        h3addresses = ["891e3097383ffff", "891E2659C2FFFF"]
+        expected = [h3.string_to_h3(h) for h in h3addresses]
+        result = str_to_int(h3addresses)
+        assert expected == result.tolist()
+
+    def test_str_to_int_invalid(self):
+        result = str_to_int(["invalid", "", "891e3097383ffff891e3097383ffff", 5])
+        assert result.tolist() == [0, 0, 0, 0]
+
+    def test_str_to_int_long_string(self):
+        h3addresses = ["891e3097383ffff", "x" * 2000, "891e2659c2fffff"]
+        expected = [h3.string_to_h3(h3addresses[0]), 0, h3.string_to_h3(h3addresses[2])]
+        result = str_to_int(h3addresses)
+        assert expected == result.tolist()
+
+
+class TestH3IsValid:
+    def test_h3_is_valid(self):
+        h3addresses = [
+            "891e3097383ffff",
+            "891e3097383fff1",  # Digit beyond the resolution is not 7
+            "8009fffffffffff",  # Pentagon base cell
+            "82080ffffffffff",  # Pentagon with a cell in the deleted K axes
+            "0",
+        ]
+        expected = [h3.h3_is_valid(h) for h in h3addresses]
+        result = h3_is_valid(str_to_int(h3addresses))
+        assert expected == result.tolist()
+
+
+class TestH3ToGeo:
+    def test_h3_to_geo(self):
+        h3address = "891e3097383ffff"
+        lat, lng = h3.h3_to_geo(h3address)
+        result = h3_to_geo(str_to_int([h3address]))
+        assert list(result) == [Point(lng, lat)]
+
+
+class TestH3ToGeoBoundary:
+    def test_h3_to_geo_boundary(self):
+        h3addresses = ["891e3097383ffff", "830800fffffffff"]  # Hexagon, pentagon
+        expected = [Polygon(h3.h3_to_geo_boundary(h, True)) for h in h3addresses]
+        result = h3_to_geo_boundary(str_to_int(h3addresses), geo_json=True)
+        assert list(result) == expected
+
+    def test_h3_to_geo_boundary_lat_lng(self):
+        h3address = "891e3097383ffff"
+        expected = Polygon(h3.h3_to_geo_boundary(h3address))
+        result = h3_to_geo_boundary(str_to_int([h3address]))
+        assert list(result) == [expected]
+
+
+class TestKRing:
+    def test_k_ring(self):
+        h3addresses = ["891e3097383ffff", "8009fffffffffff"]  # Hexagon, pentagon
+        cells, counts = k_ring(str_to_int(h3addresses), 1)
+        assert counts.tolist() == [7, 6]
+        assert set(int_to_str(cells[:7])) == h3.k_ring(h3addresses[0], 1)
+        assert set(int_to_str(cells[7:])) == h3.k_ring(h3addresses[1], 1)
+
+    def test_k_ring_threads(self, monkeypatch):
+        monkeypatch.setattr(functools, "gil_enabled", lambda: False)
+        monkeypatch.setattr(functools.os, "cpu_count", lambda: 2)
+        monkeypatch.setattr(vect, "run_chunked", partial(run_chunked, min_size=1))
+        h3addresses = str_to_int(["891e3097383ffff", "8009fffffffffff"] * 3)
+        cells, counts = k_ring(h3addresses, 1)
+        assert counts.tolist() == [7, 6] * 3
+        assert cells.tolist() == k_ring(h3addresses[:2], 1)[0].tolist() * 3
+
+
+class TestHexRing:
+    def test_hex_ring(self):
+        h3addresses = ["891e3097383ffff", "8009fffffffffff"]  # Hexagon, pentagon
+        cells, counts = hex_ring(str_to_int(h3addresses), 1)
+        assert counts.tolist() == [6, 5]
+        assert set(int_to_str(cells[:6])) == h3.hex_ring(h3addresses[0], 1)
+        assert set(int_to_str(cells[6:])) == h3.hex_ring(h3addresses[1], 1)